@@ -1,9 +1,104 @@
 import json
-from typing import List, Dict, Any
+import os
+import re
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import suppress
+from itertools import chain, islice
+from json.encoder import encode_basestring
+from typing import List, Dict, Any, Callable, Iterable, Iterator, NamedTuple, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# JSON encoder: orjson when it is installed, the standard json module otherwise.
+# Indentation is 2 spaces with orjson (the only width it supports), 4 with json.
+# _dumps_compact() serializes without whitespace, and _dumps_str() is the fast
+# path for quoting a single string value.
+if orjson is not None:
+    _INDENT = b'  '
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _dumps_compact = orjson.dumps
+    _dumps_str = orjson.dumps
+else:
+    _INDENT = b'    '
+
+    def _dumps(obj: Any) -> bytes:
+        # The serialized data is always a tree, so skip cycle detection.
+        return json.dumps(obj, indent=4, ensure_ascii=False, check_circular=False).encode()
+
+    def _dumps_compact(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False, check_circular=False).encode()
+
+    def _dumps_str(value: str) -> bytes:
+        # No codec argument: the default UTF-8 path skips the codec-name lookup.
+        return encode_basestring(value).encode()
 
 
 # Constants
 BYPASS_PATTERNS = ["127.0.0.1", "::1", "localhost"]
+# Never handed out itself: create_bypass_list() gives each profile its own copy.
+BYPASS_LIST = tuple({"conditionType": "BypassCondition", "pattern": pattern} for pattern in BYPASS_PATTERNS)
+# ip:port:username:password, validated and split in a single match. Only the
+# first three colons separate fields, so passwords may contain colons. Hosts
+# are capped at 253 characters, the longest valid DNS name, so garbage lines
+# are rejected after a bounded scan.
+PROXY_RE = re.compile(r"([^:]{1,253}):([0-9]{1,5}):([^:]*):(.*)")
+MAX_PORT = 65535
+PROFILE_PREFIX = "+m"
+# In verbose mode, only this many malformed proxies are listed individually.
+MAX_MALFORMED_WARNINGS = 100
+# Lists shorter than this are converted in-process even when workers are requested.
+PARALLEL_MIN_PROXIES = 50_000
+PARALLEL_CHUNK_SIZE = 10_000
+
+
+def iter_proxies(input_file: str) -> Iterator[str]:
+    """
+    Lazily yield the stripped, non-empty lines of a proxy file.
+
+    Only one line is held at a time, so arbitrarily large files can be
+    converted in constant memory. Errors opening or decoding the file are
+    raised on iteration.
+
+    Args:
+        input_file (str): Path to the input file containing proxies.
+
+    Yields:
+        str: A proxy string.
+    """
+    with open(input_file, 'r', encoding='utf-8', buffering=1 << 20) as file:
+        for line in file:
+            if stripped := line.strip():
+                yield stripped
+
+
+def _iter_unique(proxies: Iterable[str]) -> Iterator[str]:
+    """Yield proxies in order, skipping repeats of lines already seen."""
+    seen = set()
+    for proxy in proxies:
+        if proxy not in seen:
+            seen.add(proxy)
+            yield proxy
+
+
+class _InputError(Exception):
+    """An error raised while reading the input, so the output writer does not report it as its own."""
+
+
+def _iter_input(proxies: Iterable[str]) -> Iterator[str]:
+    """Yield proxies, re-raising read and decode errors as _InputError."""
+    try:
+        yield from proxies
+    except (OSError, UnicodeDecodeError) as e:
+        raise _InputError(e) from e
 
 
 def load_proxies(input_file: str) -> List[str]:
@@ -18,8 +113,7 @@ def load_proxies(input_file: str) -> List[str]:
         List[str]: A list of proxy strings.
     """
     try:
-        with open(input_file, 'r', encoding='utf-8') as file:
-            proxies = [line.strip() for line in file if line.strip()]
+        proxies = list(iter_proxies(input_file))
         if not proxies:
             print("Warning: No proxies found in the file.")
         return proxies
@@ -31,42 +125,59 @@ def load_proxies(input_file: str) -> List[str]:
         return []
 
 
-def create_proxy_data(ip: str, port: str, username: str, password: str, index: int) -> Dict[str, Any]:
+def create_bypass_list() -> List[Dict[str, str]]:
+    """
+    Create a fresh bypass list, so editing one profile's list never affects another.
+
+    Returns:
+        List[Dict[str, str]]: Bypass conditions for BYPASS_PATTERNS.
+    """
+    return [dict(condition) for condition in BYPASS_LIST]
+
+
+# Constant part of every proxy profile. The None values mark the per-proxy keys,
+# which create_proxy_data() fills in without changing the key order.
+PROXY_PROFILE_BASE = {
+    "profileType": "FixedProfile",
+    "name": None,
+    "bypassList": None,
+    "color": "#ca0",
+    "revision": "190a4bca575",
+    "fallbackProxy": None,
+    "auth": None,
+}
+
+
+def create_proxy_data(name: str, ip: str, port: int, username: str, password: str) -> Dict[str, Any]:
     """
     Create a dictionary for a proxy configuration.
 
     Args:
+        name (str): Profile name, e.g. "+m1".
         ip (str): Proxy IP address.
-        port (str): Proxy port.
+        port (int): Proxy port.
         username (str): Username for authentication.
         password (str): Password for authentication.
-        index (int): Index of the proxy.
 
     Returns:
         Dict[str, Any]: Proxy configuration dictionary.
     """
-    return {
-        "profileType": "FixedProfile",
-        "name": f"+m{index + 1}",
-        "bypassList": [{"conditionType": "BypassCondition", "pattern": pattern} for pattern in BYPASS_PATTERNS],
-        "color": "#ca0",
-        "revision": "190a4bca575",
-        "fallbackProxy": {"scheme": "http", "host": ip, "port": int(port)},
-        "auth": {"fallbackProxy": {"username": username, "password": password}},
-    }
+    profile = PROXY_PROFILE_BASE.copy()
+    profile["name"] = name
+    profile["bypassList"] = create_bypass_list()
+    profile["fallbackProxy"] = {"scheme": "http", "host": ip, "port": port}
+    profile["auth"] = {"fallbackProxy": {"username": username, "password": password}}
+    return profile
 
 
-def generate_output_data(proxies: List[str]) -> Dict[str, Any]:
+def create_static_data() -> Dict[str, Any]:
     """
-    Generate the output JSON structure from a list of proxies.
-
-    Args:
-        proxies (List[str]): List of proxy strings.
+    Create the profiles and settings that every configuration starts with.
 
     Returns:
-        Dict[str, Any]: JSON-compatible dictionary containing proxy configurations.
+        Dict[str, Any]: JSON-compatible dictionary of the static entries.
     """
-    output_data = {
+    return {
         "+auto switch": {
             "color": "#99dd99",
             "defaultProfileName": "direct",
@@ -85,7 +196,7 @@ def generate_output_data(proxies: List[str]) -> Dict[str, Any]:
         },
         "+proxy": {
             "auth": {},
-            "bypassList": [{"conditionType": "BypassCondition", "pattern": pattern} for pattern in BYPASS_PATTERNS],
+            "bypassList": create_bypass_list(),
             "color": "#99ccee",
             "fallbackProxy": {"host": "127.0.0.1", "port": 80, "scheme": "http"},
             "name": "proxy",
@@ -106,50 +217,390 @@ def generate_output_data(proxies: List[str]) -> Dict[str, Any]:
         "schemaVersion": 2,
     }
 
-    for index, proxy in enumerate(proxies):
-        try:
-            ip, port, username, password = proxy.split(':')
-            output_data[f"+m{index + 1}"] = create_proxy_data(ip, port, username, password, index)
-        except ValueError:
+
+class ProxyEntry(NamedTuple):
+    """Fields of one parsed proxy line."""
+
+    ip: str
+    port: int
+    username: str
+    password: str
+
+
+def _split_proxy(proxy: str) -> Optional[Tuple[str, int, str, str]]:
+    """
+    Validate a proxy string and return its fields as a plain tuple.
+
+    This is the single definition of a well-formed line, shared by
+    parse_proxy() and the streaming loop in _iter_rendered_members(), which
+    skips the ProxyEntry wrapper.
+    """
+    match = PROXY_RE.fullmatch(proxy)
+    if match is None:
+        return None
+    ip, port, username, password = match.groups()
+    port = int(port)
+    if port > MAX_PORT:
+        return None
+    return ip, port, username, password
+
+
+def parse_proxy(proxy: str) -> Optional[ProxyEntry]:
+    """
+    Validate a proxy string and split it into its fields.
+
+    Args:
+        proxy (str): Proxy string in the format ip:port:username:password;
+            everything after the third colon is the password.
+
+    Returns:
+        Optional[ProxyEntry]: The parsed fields, or None if the string is malformed.
+    """
+    fields = _split_proxy(proxy)
+    return None if fields is None else ProxyEntry._make(fields)
+
+
+class MalformedReport:
+    """
+    Count skipped proxy strings, optionally warning about each one.
+
+    With verbose off, a bad line costs a counter increment instead of a print,
+    and a single summary is printed once the input has been processed. Verbose
+    warnings stop after MAX_MALFORMED_WARNINGS, so a mostly broken list does
+    not flood the console; the summary still counts every skipped line.
+    """
+
+    def __init__(self, verbose: bool = True) -> None:
+        self.verbose = verbose
+        self.count = 0
+
+    def add(self, proxy: str) -> None:
+        """Record a skipped proxy string."""
+        self.count += 1
+        if self.verbose and self.count <= MAX_MALFORMED_WARNINGS:
             print(f"Warning: Proxy '{proxy}' is incorrectly formatted. Skipping.")
 
+    def print_summary(self) -> None:
+        """Print the number of skipped proxy strings, if any."""
+        if self.count:
+            noun = "proxy" if self.count == 1 else "proxies"
+            print(f"Warning: Skipped {self.count} incorrectly formatted {noun}.")
+            if self.verbose and self.count > MAX_MALFORMED_WARNINGS:
+                print(f"Only the first {MAX_MALFORMED_WARNINGS} are listed above.")
+
+
+def iter_proxy_entries(proxies: Iterable[str], report: MalformedReport) -> Iterator[Tuple[int, ProxyEntry]]:
+    """
+    Validate proxy strings and yield each well-formed one.
+
+    Malformed entries are recorded in the report and skipped; they still
+    consume an index, so profile numbers follow the line numbers of the
+    non-empty input.
+
+    Args:
+        proxies (Iterable[str]): Proxy strings.
+        report (MalformedReport): Collects the skipped entries.
+
+    Yields:
+        Tuple[int, ProxyEntry]: Profile number and parsed fields.
+    """
+    for number, proxy in enumerate(proxies, 1):
+        entry = parse_proxy(proxy)
+        if entry is None:
+            report.add(proxy)
+            continue
+        yield number, entry
+
+
+def generate_output_data(proxies: List[str], verbose: bool = True) -> Dict[str, Any]:
+    """
+    Generate the output JSON structure from a list of proxies.
+
+    Args:
+        proxies (List[str]): List of proxy strings.
+        verbose (bool): Warn about every malformed proxy, not just the total.
+
+    Returns:
+        Dict[str, Any]: JSON-compatible dictionary containing proxy configurations.
+    """
+    output_data = create_static_data()
+    report = MalformedReport(verbose)
+    for number, entry in iter_proxy_entries(proxies, report):
+        name = f"{PROFILE_PREFIX}{number}"
+        output_data[name] = create_proxy_data(name, *entry)
+    report.print_summary()
     return output_data
 
 
-def write_output_file(output_data: Dict[str, Any], output_file: str) -> None:
+# Separator between top-level members, keyed by the pretty flag.
+_SEPARATORS = {True: b',\n', False: b','}
+
+
+def _render_member(key: str, value: Any, pretty: bool = True) -> bytes:
+    """Serialize one top-level '"key": value' member, indented one level unless compact."""
+    if not pretty:
+        return _dumps_compact(key) + b':' + _dumps_compact(value)
+    return _INDENT + _dumps(key) + b': ' + _dumps(value).replace(b'\n', b'\n' + _INDENT)
+
+
+# Order in which the fields appear in a serialized profile, i.e. the order of
+# the positional arguments to the profile templates.
+_PROFILE_TEMPLATE_FIELDS = ("number", "number", "ip", "port", "username", "password")
+# A "\x00field\x00" placeholder as serialized: a whole quoted JSON value, or a
+# bare fragment inside a longer string.
+_PLACEHOLDER_RE = re.compile(rb'(")?\\u0000(\w+)\\u0000(?(1)")')
+
+
+def _build_profile_template(pretty: bool = True) -> bytes:
     """
-    Write the output data structure to a JSON file.
+    Pre-render a proxy profile member as a %-format template.
+
+    create_proxy_data() is serialized once with placeholder strings, which are
+    then swapped for positional conversion specifiers. Rendering a profile is
+    then a single bytes formatting operation instead of building and encoding
+    dicts.
+    """
+    placeholders = {field: f"\x00{field}\x00" for field in ("number", "ip", "port", "username", "password")}
+    name = PROFILE_PREFIX + placeholders.pop("number")
+    template = _render_member(name, create_proxy_data(name, **placeholders), pretty).replace(b'%', b'%%')
+    fields = tuple(match[2].decode() for match in _PLACEHOLDER_RE.finditer(template))
+    if fields != _PROFILE_TEMPLATE_FIELDS:
+        raise RuntimeError(f"Unexpected proxy profile field order: {fields}")
+    return _PLACEHOLDER_RE.sub(lambda match: b'%d' if match[2] in (b'number', b'port') else b'%s', template)
+
+
+# Both layouts are prepared at import, keyed by the pretty flag. The static
+# entries never change, so they are serialized once as well.
+_PROFILE_TEMPLATES = {pretty: _build_profile_template(pretty) for pretty in (True, False)}
+_STATIC_MEMBERS = {
+    pretty: _SEPARATORS[pretty].join(_render_member(key, value, pretty) for key, value in create_static_data().items())
+    for pretty in (True, False)
+}
+
+
+def _iter_rendered_members(
+    proxies: Iterable[str], reject: Callable[[str], None], start: int = 1, pretty: bool = True
+) -> Iterator[bytes]:
+    """
+    Parse and render proxies in a single pass.
+
+    This is the hot loop: lines are validated by _split_proxy() and formatted
+    straight into the profile template, the same output as serializing
+    create_proxy_data() but with no intermediate ProxyEntry or dict.
 
     Args:
-        output_data (Dict[str, Any]): Data to write to the file.
+        proxies (Iterable[str]): Non-empty, stripped proxy strings.
+        reject (Callable[[str], None]): Called with each malformed proxy string.
+        start (int): Profile number of the first proxy.
+        pretty (bool): Indent the members; False renders them without whitespace.
+
+    Yields:
+        bytes: Serialized profile members, in input order.
+    """
+    template = _PROFILE_TEMPLATES[pretty]
+    dumps_str = _dumps_str
+    for number, proxy in enumerate(proxies, start):
+        fields = _split_proxy(proxy)
+        if fields is None:
+            reject(proxy)
+            continue
+        ip, port, username, password = fields
+        yield template % (number, number, dumps_str(ip), port, dumps_str(username), dumps_str(password))
+
+
+def _iter_chunks(proxies: Iterable[str], size: int) -> Iterator[Tuple[int, List[str]]]:
+    """Split proxies into lists of at most size items, each with its first profile number."""
+    iterator = iter(proxies)
+    number = 1
+    while chunk := list(islice(iterator, size)):
+        yield number, chunk
+        number += len(chunk)
+
+
+def _render_chunk(chunk: Tuple[int, List[str]], pretty: bool = True) -> Tuple[bytes, List[str]]:
+    """
+    Render one chunk of proxies; runs in a worker process.
+
+    Returns the comma-separated profile members and the rejected proxy
+    strings, which the parent reports so warnings keep their input order.
+    """
+    number, proxies = chunk
+    rejected = []
+    members = _SEPARATORS[pretty].join(_iter_rendered_members(proxies, rejected.append, number, pretty))
+    return members, rejected
+
+
+def _iter_members_parallel(
+    proxies: Iterable[str], workers: int, report: MalformedReport, pretty: bool = True
+) -> Iterator[bytes]:
+    """
+    Render proxies in a process pool, yielding the chunks in input order.
+
+    At most two chunks per worker are in flight, so the input is still read
+    incrementally instead of being queued up front as Executor.map would.
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        chunks = _iter_chunks(proxies, PARALLEL_CHUNK_SIZE)
+        while True:
+            for chunk in islice(chunks, 2 * workers - len(pending)):
+                pending.append(executor.submit(_render_chunk, chunk, pretty))
+            if not pending:
+                break
+            members, rejected = pending.popleft().result()
+            for proxy in rejected:
+                report.add(proxy)
+            if members:
+                yield members
+
+
+def iter_output_data(
+    proxies: Iterable[str], workers: int = 1, verbose: bool = True, pretty: bool = True
+) -> Iterator[bytes]:
+    """
+    Yield the serialized top-level members of the output JSON structure.
+
+    The static profiles and settings come first, followed by one profile per
+    valid proxy, so the configuration can be written without holding it all
+    in memory. With more than one worker, proxies are parsed and rendered in
+    chunks by a process pool and the results are yielded in input order.
+
+    Args:
+        proxies (Iterable[str]): Proxy strings.
+        workers (int): Number of worker processes; 1 renders in-process.
+        verbose (bool): Warn about every malformed proxy, not just the total.
+        pretty (bool): Indent the members; False renders them without whitespace.
+
+    Yields:
+        bytes: One or more comma-separated '"key": value' members, indented for
+        the top-level object unless compact.
+    """
+    yield _STATIC_MEMBERS[pretty]
+
+    report = MalformedReport(verbose)
+    if workers <= 1:
+        yield from _iter_rendered_members(proxies, report.add, pretty=pretty)
+    else:
+        yield from _iter_members_parallel(proxies, workers, report, pretty)
+    report.print_summary()
+
+
+def _write_members(members: Iterable[bytes], output_file: str, pretty: bool = True) -> None:
+    """
+    Stream serialized top-level members to a JSON file as a single object.
+
+    Members are written as they arrive, so the whole document never exists in
+    memory at once. The data goes to a temporary file next to the target,
+    which is synced and then moved into place, so an interrupted run never
+    leaves a truncated configuration behind.
+
+    Args:
+        members (Iterable[bytes]): Serialized members, e.g. from iter_output_data().
         output_file (str): Path to the output file.
+        pretty (bool): Put each member on its own line; False writes the
+            object on a single line, matching compact members.
     """
+    newline = b'\n' if pretty else b''
+    tmp_file = None
     try:
-        with open(output_file, 'w', encoding='utf-8') as file:
-            json.dump(output_data, file, indent=4, ensure_ascii=False)
+        # A unique name, so an existing file is never clobbered or removed.
+        fd, tmp_file = tempfile.mkstemp(
+            dir=os.path.dirname(output_file) or '.', prefix=f"{os.path.basename(output_file)}.", suffix='.tmp'
+        )
+        with open(fd, 'wb', buffering=1 << 20) as file:
+            file.write(b'{')
+            separator = newline
+            for member in members:
+                file.write(separator + member)
+                separator = _SEPARATORS[pretty]
+            file.write(newline + b'}' if separator == _SEPARATORS[pretty] else b'}')
+            file.flush()
+            os.fsync(file.fileno())
+        # mkstemp() creates the file as 0600; give it the usual permissions.
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_file, 0o666 & ~umask)
+        os.replace(tmp_file, output_file)
         print(f"Output successfully written to '{output_file}'")
     except IOError as e:
-        print(f"Error writing to the file '{output_file}': {e}")
+        # strerror leaves out the temporary file's name.
+        print(f"Error writing to the file '{output_file}': {e.strerror or e}")
+    finally:
+        if tmp_file is not None:
+            with suppress(FileNotFoundError):
+                os.remove(tmp_file)
 
 
-def convert_proxy_list(input_file: str, output_file: str) -> None:
+def write_output_file(output_data: Dict[str, Any], output_file: str, pretty: bool = True) -> None:
+    """
+    Write the output data structure to a JSON file.
+
+    Args:
+        output_data (Dict[str, Any]): Data to write, e.g. from generate_output_data().
+        output_file (str): Path to the output file.
+        pretty (bool): Write indented JSON; False writes compact JSON.
+    """
+    _write_members((_render_member(key, value, pretty) for key, value in output_data.items()), output_file, pretty)
+
+
+def convert_proxy_list(
+    input_file: str,
+    output_file: str,
+    workers: int = 1,
+    dedupe: bool = False,
+    verbose: bool = True,
+    pretty: bool = True,
+) -> None:
     """
     Convert a proxy list from a file to a structured JSON configuration.
 
     Args:
         input_file (str): Path to the input file.
         output_file (str): Path to the output file.
+        workers (int): Worker processes for lists of at least
+            PARALLEL_MIN_PROXIES entries; 1 keeps everything in-process.
+        dedupe (bool): Drop repeated proxy lines, keeping the first occurrence.
+        verbose (bool): Warn about every malformed proxy, not just the total.
+        pretty (bool): Write indented JSON; False writes compact JSON, which is
+            smaller and faster to produce.
     """
-    proxies = load_proxies(input_file)
-    if proxies:
-        output_data = generate_output_data(proxies)
-        write_output_file(output_data, output_file)
-    else:
+    proxies = iter_proxies(input_file)
+    if dedupe:
+        proxies = _iter_unique(proxies)
+    try:
+        # One line tells an empty file; with workers, read on far enough to
+        # tell a list too short for them.
+        head = list(islice(proxies, 1))
+        if workers > 1 and len(head) < PARALLEL_MIN_PROXIES:
+            head.extend(islice(proxies, PARALLEL_MIN_PROXIES - len(head)))
+    except FileNotFoundError:
+        print(f"Error: File '{input_file}' not found.")
+        return
+    except Exception as e:
+        print(f"Error reading the file '{input_file}': {e}")
+        return
+
+    if not head:
+        print("Warning: No proxies found in the file.")
         print("No valid proxies loaded. Exiting.")
+        return
+    if len(head) < PARALLEL_MIN_PROXIES:
+        workers = 1
+
+    try:
+        # Lines are read, converted and written in a single streaming pass.
+        members = iter_output_data(chain(head, _iter_input(proxies)), workers, verbose, pretty)
+        _write_members(members, output_file, pretty)
+    except _InputError as e:
+        print(f"Error reading the file '{input_file}': {e.__cause__}")
 
 
 # Entry point
 if __name__ == "__main__":
     input_file = "proxy_list.txt"  # Replace with your input file name
     output_file = "output.json"    # Replace with your desired output file name
-    convert_proxy_list(input_file, output_file)
+    workers = 1                    # Raise to use several processes on very large lists
+    dedupe = False                 # Set to True to skip repeated proxy lines
+    verbose = True                 # Set to False to print only the count of malformed proxies
+    pretty = True                  # Set to False to write compact single-line JSON
+    convert_proxy_list(input_file, output_file, workers, dedupe, verbose, pretty)
@@ -0,0 +1,95 @@
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import convert_proxy
+
+
+# Fields exercising the template: format characters, JSON escapes, non-ASCII
+# text and control characters. Each line must survive line.strip() unchanged.
+PROXY_LINES = [
+    "1.1.1.1:80:user%d:pa%s%%ss",
+    'host.example.com:8080:u"ser:pa\\ss\\"',
+    "ünï.example:1:用户:pässwörd:with:colons",
+    "10.0.0.1:65535:ctl\x01\x1f\x7f:nul\x00  end",
+    "10.0.0.2:3128:%(name)s:{}",
+    "bad line",
+    "10.0.0.3:65536:u:p",
+    "10.0.0.4:443::",
+]
+
+
+def _load_without_orjson():
+    """Import a separate copy of the module that uses the json fallback."""
+    spec = importlib.util.spec_from_file_location("convert_proxy_stdlib", convert_proxy.__file__)
+    module = importlib.util.module_from_spec(spec)
+    with mock.patch.dict(sys.modules, {"orjson": None}):
+        spec.loader.exec_module(module)
+    return module
+
+
+def _expected(module, data, pretty):
+    """Serialize data the way the module's encoder would serialize the whole dict."""
+    if module.orjson is not None:
+        return module.orjson.dumps(data, option=module.orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(data, indent=4, ensure_ascii=False).encode()
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode()
+
+
+class StreamingOutputTest(unittest.TestCase):
+    """The streamed configuration must be byte-identical to serializing generate_output_data()."""
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.input_file = os.path.join(tmp_dir.name, "proxies.txt")
+        self.output_file = os.path.join(tmp_dir.name, "output.json")
+        with open(self.input_file, 'w', encoding='utf-8', newline='\n') as file:
+            file.write("\n".join(PROXY_LINES[:3] + [""] + PROXY_LINES[3:]) + "\n")
+
+    def _convert(self, module, **kwargs):
+        with contextlib.redirect_stdout(io.StringIO()):
+            module.convert_proxy_list(self.input_file, self.output_file, **kwargs)
+            data = module.generate_output_data(list(module.iter_proxies(self.input_file)))
+        with open(self.output_file, 'rb') as file:
+            return file.read(), data
+
+    def _check_modules(self, modules, **kwargs):
+        for module in modules:
+            for pretty in (True, False):
+                with self.subTest(encoder="json" if module.orjson is None else "orjson", pretty=pretty):
+                    output, data = self._convert(module, pretty=pretty, **kwargs)
+                    self.assertEqual(output, _expected(module, data, pretty))
+
+    def test_matches_dict_serialization(self):
+        self._check_modules([convert_proxy, _load_without_orjson()])
+
+    def test_process_pool_matches_dict_serialization(self):
+        with mock.patch.object(convert_proxy, "PARALLEL_MIN_PROXIES", 1), \
+                mock.patch.object(convert_proxy, "PARALLEL_CHUNK_SIZE", 2):
+            self._check_modules([convert_proxy], workers=2)
+
+    def test_write_output_file_matches_streaming(self):
+        for pretty in (True, False):
+            with self.subTest(pretty=pretty):
+                output, data = self._convert(convert_proxy, pretty=pretty)
+                with contextlib.redirect_stdout(io.StringIO()):
+                    convert_proxy.write_output_file(data, self.output_file, pretty)
+                with open(self.output_file, 'rb') as file:
+                    self.assertEqual(file.read(), output)
+
+    def test_profile_numbers_skip_malformed_lines(self):
+        _, data = self._convert(convert_proxy)
+        names = [key for key in data if key.startswith(convert_proxy.PROFILE_PREFIX)]
+        self.assertEqual(names, ["+m1", "+m2", "+m3", "+m4", "+m5", "+m8"])
+
+
+if __name__ == "__main__":
+    unittest.main()